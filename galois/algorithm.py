@@ -68,7 +68,7 @@ def gcd(a, b):
     return r2, s2, t2
 
 
-@numba.jit("int64[:](int64, int64)", nopython=True)
+@numba.jit("int64[:](int64, int64)", nopython=True, nogil=True)
 def _gcd_jit(a, b):  # pragma: no cover
     r = [a, b]
     s = [1, 0]
@@ -1,3 +1,4 @@
+import functools
 import random
 
 import numpy as np
@@ -10,21 +11,22 @@ from .poly_conversion import integer_to_poly, poly_to_str, str_to_integer
 __all__ = ["GFArray"]
 
 
-UNSUPPORTED_ONE_ARG_FUNCTIONS = [
+UNSUPPORTED_ONE_ARG_FUNCTIONS = (
     np.packbits, np.unpackbits,
     np.unwrap,
     np.around, np.round_, np.fix,
     np.gradient, np.trapz,
     np.i0, np.sinc,
     np.angle, np.real, np.imag, np.conj, np.conjugate,
-]
+)
 
-UNSUPPORTED_TWO_ARG_FUNCTIONS = [
+UNSUPPORTED_TWO_ARG_FUNCTIONS = (
     np.lib.scimath.logn,
     np.cross,
-]
+)
 
-UNSUPPORTED_FUNCTIONS = UNSUPPORTED_ONE_ARG_FUNCTIONS + UNSUPPORTED_TWO_ARG_FUNCTIONS
+# Membership is tested on every __array_function__ call, so use frozensets for O(1) lookups
+UNSUPPORTED_FUNCTIONS = frozenset(UNSUPPORTED_ONE_ARG_FUNCTIONS + UNSUPPORTED_TWO_ARG_FUNCTIONS)
 
 OVERRIDDEN_FUNCTIONS = {
     np.dot: dot,
@@ -37,13 +39,13 @@ OVERRIDDEN_FUNCTIONS = {
     np.linalg.solve: solve
 }
 
-FUNCTIONS_REQUIRING_VIEW = [
+FUNCTIONS_REQUIRING_VIEW = frozenset((
     np.copy, np.concatenate,
     np.broadcast_to,
     np.trace,
-]
+))
 
-UNSUPPORTED_ONE_ARG_UFUNCS = [
+UNSUPPORTED_ONE_ARG_UFUNCS = (
     np.invert, np.sqrt,
     np.log2, np.log10,
     np.exp, np.expm1, np.exp2,
@@ -54,17 +56,17 @@ UNSUPPORTED_ONE_ARG_UFUNCS = [
     np.degrees, np.radians,
     np.deg2rad, np.rad2deg,
     np.floor, np.ceil, np.trunc, np.rint,
-]
+)
 
-UNSUPPORTED_TWO_ARG_UFUNCS = [
+UNSUPPORTED_TWO_ARG_UFUNCS = (
     np.hypot, np.arctan2,
     np.logaddexp, np.logaddexp2,
     np.remainder,
     np.fmod, np.modf,
     np.fmin, np.fmax,
-]
+)
 
-UNSUPPORTED_UFUNCS = UNSUPPORTED_ONE_ARG_UFUNCS + UNSUPPORTED_TWO_ARG_UFUNCS
+UNSUPPORTED_UFUNCS = frozenset(UNSUPPORTED_ONE_ARG_UFUNCS + UNSUPPORTED_TWO_ARG_UFUNCS)
 
 OVERRIDDEN_UFUNCS = {
     np.add: "_ufunc_add",
@@ -80,10 +82,42 @@ OVERRIDDEN_UFUNCS = {
     np.matmul: "_ufunc_matmul",
 }
 
-UFUNCS_REQUIRING_VIEW = [
+UFUNCS_REQUIRING_VIEW = frozenset((
     np.bitwise_and, np.bitwise_or, np.bitwise_xor,
     np.left_shift, np.right_shift,
-]
+))
+
+# Largest identity matrix size cached by Identity(). Buffers are shared across field classes
+# since they only depend on (size, dtype).
+IDENTITY_CACHE_MAX_SIZE = 64
+
+
+@functools.lru_cache(maxsize=32)
+def _identity_cached(size, dtype):
+    array = np.identity(size, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+@functools.lru_cache(maxsize=64)
+def _classify_operands(field, input_types, pop_second):
+    """
+    Classifies the ufunc operand indices as field or non-field operands. Small-array workloads
+    re-dispatch the same handful of input type patterns, so the classification is cached to skip
+    the per-call isinstance scans.
+    """
+    operands = list(range(len(input_types)))
+    if pop_second:
+        # Remove the second argument for "at" ufuncs which is the indices list
+        operands.pop(1)
+    field_operands = []
+    non_field_operands = []
+    for i in operands:
+        if issubclass(input_types[i], field):
+            field_operands.append(i)
+        else:
+            non_field_operands.append(i)
+    return tuple(operands), tuple(field_operands), tuple(non_field_operands)
 
 
 @set_module("galois")
@@ -211,6 +245,14 @@ class GFArray(np.ndarray, metaclass=GFMeta):
         a
     """
 
+    # Flag checked in __array_finalize__ to skip validation of view casts performed by internal
+    # constructors, whose data is valid by construction. User-facing view casts are still validated.
+    _trust_view = False
+
+    # Per-field-class cache of {ufunc: bound handler method}, built lazily on the first
+    # __array_ufunc__ call so dispatch is a single dict lookup
+    _ufunc_dispatch = None
+
     def __new__(cls, array, dtype=None, copy=True, order="K", ndmin=0):
         if cls is GFArray:
             raise NotImplementedError("GFArray is an abstract base class that cannot be directly instantiated. Instead, create a GFArray subclass using `galois.GF`.")
@@ -224,20 +266,43 @@ class GFArray(np.ndarray, metaclass=GFMeta):
         # Convert "dtype" to a numpy dtype. This does platform specific conversion, if necessary.
         # For example, np.dtype(int) == np.int64 (on some systems).
         dtype = np.dtype(dtype)
-        if dtype not in cls.dtypes:
+        if dtype not in cls._dtype_set:  # pylint: disable=unsupported-membership-test
             raise TypeError(f"{cls.name} arrays only support dtypes {[np.dtype(d).name for d in cls.dtypes]}, not '{dtype.name}'.")
 
         return dtype
 
+    @classmethod
+    def _view_without_verification(cls, array):
+        """
+        View cast `array` to this class, skipping the value validation in `__array_finalize__`. The
+        caller must guarantee the array has a valid dtype and all values are in the field.
+        """
+        cls._trust_view = True
+        try:
+            return array.view(cls)
+        finally:
+            cls._trust_view = False
+
     @classmethod
     def _array(cls, array_like, dtype=None, copy=True, order="K", ndmin=0):
         dtype = cls._get_dtype(dtype)
         array_like = cls._check_array_like_object(array_like)
+        if not copy and isinstance(array_like, np.ndarray) and array_like.dtype == dtype and order == "K" and array_like.ndim >= ndmin:
+            # The input is already a valid ndarray of the target dtype and the caller requested zero-copy,
+            # so a view cast avoids np.array()'s memcpy
+            return cls._view_without_verification(array_like)
         array = np.array(array_like, dtype=dtype, copy=copy, order=order, ndmin=ndmin)
-        return array.view(cls)
+        return cls._view_without_verification(array)
 
     @classmethod
     def _check_array_like_object(cls, array_like):
+        if isinstance(array_like, cls) and array_like.dtype != np.object_:
+            # The array is already a Galois field array over this field, so its values are known
+            # to be valid by class invariant (enforced on construction and every assignment).
+            # Skip the full revalidation scan. Object-dtype arrays still take the full path so
+            # their elements are re-coerced to python ints.
+            return array_like
+
         if isinstance(array_like, str):
             # Convert the string to an integer
             array_like = str_to_integer(array_like, cls.prime_subfield)
@@ -265,6 +330,18 @@ class GFArray(np.ndarray, metaclass=GFMeta):
 
     @classmethod
     def _check_iterable_types_and_values(cls, iterable):
+        # Fast path: most iterables are plain (possibly nested) lists of ints. Those convert
+        # cleanly to an integer ndarray, which can be bounds-checked with one vectorized pass
+        # instead of a Python-level recursion over every element. Iterables containing strings,
+        # Galois field scalars, or ragged nesting fall back to the recursive per-element path.
+        try:
+            array = np.asarray(iterable)
+        except ValueError:
+            array = None
+        if array is not None and array.dtype.kind in ["i", "u"]:
+            cls._check_array_values(array)
+            return array
+
         new_iterable = []
         for item in iterable:
             if isinstance(item, (list, tuple)):
@@ -294,14 +371,15 @@ class GFArray(np.ndarray, metaclass=GFMeta):
                 raise TypeError(f"When {cls.name} arrays are created/assigned with a numpy array with dtype=object, each element must be an integer. Found type {type(array[()])}.")
             return int(array)
 
-        iterator = np.nditer(array, flags=["multi_index", "refs_ok"])
-        for _ in iterator:
-            a = array[iterator.multi_index]
+        # Iterate over a flat view, which avoids invoking numpy's full indexing machinery
+        # (and a multi-index tuple allocation) on every element
+        for a in array.flat:
             if not isinstance(a, (int, np.integer, cls)):
                 raise TypeError(f"When {cls.name} arrays are created/assigned with a numpy array with dtype=object, each element must be an integer. Found type {type(a)}.")
 
-            # Ensure the type is int so dtype=object classes don't get all mixed up
-            array[iterator.multi_index] = int(a)
+        # Ensure the types are int so dtype=object classes don't get all mixed up. np.frompyfunc
+        # coerces all elements in a single C loop.
+        array[...] = np.frompyfunc(int, 1, 1)(array)
 
         return array
 
@@ -311,10 +389,17 @@ class GFArray(np.ndarray, metaclass=GFMeta):
             # Convert single integer to array so next step doesn't fail
             array = np.array(array)
 
-        # Check the value of the "field elements" and make sure they are valid
-        if np.any(array < 0) or np.any(array >= cls.order):
-            idxs = np.logical_or(array < 0, array >= cls.order)
-            raise ValueError(f"{cls.name} arrays must have elements in 0 <= x < {cls.order}, not {array[idxs]}.")
+        # Check the value of the "field elements" and make sure they are valid. Unsigned dtypes
+        # can't be negative, so a single upper-bounds check suffices and one full pass over the
+        # data (and its boolean temporary) is avoided. The mask is computed once and reused for
+        # both the any() reduction and the out-of-range values in the error message.
+        if array.dtype.kind == "u":
+            mask = array >= cls.order
+        else:
+            mask = np.empty(array.shape, dtype=bool)
+            np.logical_or(array < 0, array >= cls.order, out=mask)
+        if mask.any():
+            raise ValueError(f"{cls.name} arrays must have elements in 0 <= x < {cls.order}, not {array[mask]}.")
 
     ###############################################################################
     # Alternate constructors
@@ -349,7 +434,7 @@ class GFArray(np.ndarray, metaclass=GFMeta):
         """
         dtype = cls._get_dtype(dtype)
         array = np.zeros(shape, dtype=dtype)
-        return array.view(cls)
+        return cls._view_without_verification(array)
 
     @classmethod
     def Ones(cls, shape, dtype=None):
@@ -380,7 +465,7 @@ class GFArray(np.ndarray, metaclass=GFMeta):
         """
         dtype = cls._get_dtype(dtype)
         array = np.ones(shape, dtype=dtype)
-        return array.view(cls)
+        return cls._view_without_verification(array)
 
     @classmethod
     def Identity(cls, size, dtype=None):
@@ -398,7 +483,9 @@ class GFArray(np.ndarray, metaclass=GFMeta):
         Returns
         -------
         galois.GFArray
-            A Galois field identity matrix of shape `(size, size)`.
+            A Galois field identity matrix of shape `(size, size)`. Small identity matrices are served
+            as read-only views of a shared cached buffer; call :func:`numpy.ndarray.copy` on the result
+            if it needs to be modified.
 
         Examples
         --------
@@ -408,8 +495,10 @@ class GFArray(np.ndarray, metaclass=GFMeta):
             GF.Identity(4)
         """
         dtype = cls._get_dtype(dtype)
+        if size <= IDENTITY_CACHE_MAX_SIZE:
+            return cls._view_without_verification(_identity_cached(size, dtype))
         array = np.identity(size, dtype=dtype)
-        return array.view(cls)
+        return cls._view_without_verification(array)
 
     @classmethod
     def Vandermonde(cls, a, m, n, dtype=None):
@@ -459,8 +548,18 @@ class GFArray(np.ndarray, metaclass=GFMeta):
         if not a.ndim == 0:
             raise ValueError(f"Argument `a` must be a scalar, not {a.ndim}-D.")
 
-        v = a ** np.arange(0, m)
-        V = np.power.outer(v, np.arange(0, n))
+        if a > 0 and cls._EXP is not None:
+            # When the lookup tables are compiled, V[i,j] = a^(i*j) = α^(log(a)*i*j mod (order - 1))
+            # reduces to a single gather from the anti-log table, instead of m*n modular
+            # exponentiations through np.power.outer. The row logs log(a)*i are reduced on the small
+            # (m,) vector first, so the (m,n) grid only sees one outer product and one modulo pass.
+            log_a = int(cls._LOG[int(a)])  # pylint: disable=unsubscriptable-object
+            row_logs = (log_a * np.arange(0, m)) % (cls.order - 1)
+            exponents = np.multiply.outer(row_logs, np.arange(0, n)) % (cls.order - 1)
+            V = cls(cls._EXP[exponents], dtype=dtype)  # pylint: disable=unsubscriptable-object
+        else:
+            v = a ** np.arange(0, m)
+            V = np.power.outer(v, np.arange(0, n))
 
         return V
 
@@ -499,10 +598,14 @@ class GFArray(np.ndarray, metaclass=GFMeta):
 
         if dtype != np.object_:
             array = np.arange(start, stop, step=step, dtype=dtype)
+        elif -2**63 <= start and stop <= 2**63 - 1:
+            # The range fits in int64, so generate with numpy's C routine and box the result
+            # into python ints afterwards, instead of materializing a python range()
+            array = np.arange(start, stop, step=step, dtype=np.int64).astype(np.object_)
         else:
             array = np.array(range(start, stop, step), dtype=dtype)
 
-        return array.view(cls)
+        return cls._view_without_verification(array)
 
     @classmethod
     def Random(cls, shape=(), low=0, high=None, dtype=None):
@@ -543,13 +646,17 @@ class GFArray(np.ndarray, metaclass=GFMeta):
 
         if dtype != np.object_:
             array = np.random.randint(low, high, shape, dtype=dtype)
+        elif high <= 2**63:
+            # The range fits in int64, so generate with numpy's C routine and box the result
+            # into python ints afterwards, instead of calling random.randint() per element
+            array = np.random.randint(low, high, shape, dtype=np.int64).astype(np.object_)
         else:
             array = np.empty(shape, dtype=dtype)
             iterator = np.nditer(array, flags=["multi_index", "refs_ok"])
             for _ in iterator:
                 array[iterator.multi_index] = random.randint(low, high - 1)
 
-        return array.view(cls)
+        return cls._view_without_verification(array)
 
     @classmethod
     def Elements(cls, dtype=None):
@@ -608,11 +715,26 @@ class GFArray(np.ndarray, metaclass=GFMeta):
         """
         order = cls.prime_subfield.order
         degree = cls.degree
-        array = cls.prime_subfield(array).view(np.ndarray).astype(cls.dtypes[-1])  # Use the largest dtype so computation doesn't overflow
+        array = cls.prime_subfield(array).view(np.ndarray)
         if not array.shape[-1] == degree:
             raise ValueError(f"The last dimension of `array` must be the field extension dimension {cls.degree}, not {array.shape[-1]}.")
-        degrees = np.arange(degree - 1, -1, -1, dtype=cls.dtypes[-1])
-        array = np.sum(array * order**degrees, axis=-1)
+
+        if order == 2:
+            # In characteristic 2 the base-2 recombination is exactly a bit-pack. np.packbits collapses
+            # each length-m vector of bits into bytes in one C pass, which are then combined base-256.
+            # Left-pad with zero bits so the vector length is a byte multiple.
+            bits = array.astype(np.uint8)
+            pad = -degree % 8
+            if pad > 0:
+                bits = np.pad(bits, [(0, 0)]*(bits.ndim - 1) + [(pad, 0)])
+            b = np.packbits(bits, axis=-1)
+            weights = 256 ** np.arange(b.shape[-1] - 1, -1, -1, dtype=cls.dtypes[-1])
+            array = np.sum(b * weights, axis=-1)
+        else:
+            array = array.astype(cls.dtypes[-1])  # Use the largest dtype so computation doesn't overflow
+            degrees = np.arange(degree - 1, -1, -1, dtype=cls.dtypes[-1])
+            array = np.sum(array * order**degrees, axis=-1)
+
         return cls(array, dtype=dtype)
 
     ###############################################################################
@@ -648,13 +770,26 @@ class GFArray(np.ndarray, metaclass=GFMeta):
         order = type(self).prime_subfield.order
         degree = type(self).degree
         array = self.view(np.ndarray)
-        array = np.repeat(array, degree).reshape(*array.shape, degree)
-        x = 0
-        for i in range(degree):
-            q = (array[...,i] - x) // order**(degree - 1 - i)
-            array[...,i] = q
-            x += q*order**(degree - 1 - i)
-        return type(self).prime_subfield(array, dtype=dtype)
+        # Compute all base-`order` digits with one broadcast expression, i.e. digit i of x is
+        # (x // order^(degree - 1 - i)) % order. This moves the digit loop from Python into
+        # numpy's C loops. Use the largest dtype so computation doesn't overflow.
+        powers = order ** np.arange(degree - 1, -1, -1, dtype=type(self).dtypes[-1])
+        digits = np.empty(array.shape + (degree,), dtype=type(self).dtypes[-1])
+        if array.size * degree > 2**16:
+            # For large arrays, extract the digits in blocks of scalars so the floor-divide and
+            # modulo passes both run over a cache-resident (block, degree) tile, instead of two
+            # full sweeps over an output that exceeds the cache
+            flat = array.reshape(-1)
+            flat_digits = digits.reshape(-1, degree)
+            block = max(1, 2**16 // degree)
+            for i in range(0, flat.size, block):
+                tile = flat_digits[i:i + block]
+                np.floor_divide(flat[i:i + block, np.newaxis], powers, out=tile)
+                tile %= order
+        else:
+            np.floor_divide(array[..., np.newaxis], powers, out=digits)
+            digits %= order
+        return type(self).prime_subfield(digits, dtype=dtype)
 
     def row_reduce(self, ncols=None):
         """
@@ -770,7 +905,7 @@ class GFArray(np.ndarray, metaclass=GFMeta):
     ###############################################################################
 
     def astype(self, dtype, **kwargs):  # pylint: disable=arguments-differ
-        if dtype not in type(self).dtypes:
+        if np.dtype(dtype) not in type(self)._dtype_set:  # pylint: disable=unsupported-membership-test
             raise TypeError(f"{type(self).name} arrays can only be cast as integer dtypes in {type(self).dtypes}, not {dtype}.")
         return super().astype(dtype, **kwargs)
 
@@ -781,28 +916,43 @@ class GFArray(np.ndarray, metaclass=GFMeta):
         """
         if obj is not None and not isinstance(obj, GFArray):
             # Only invoked on view casting
+            if type(self)._trust_view:
+                # Internal constructors guarantee valid data, see _view_without_verification()
+                return
             if obj.dtype not in type(self).dtypes:
                 raise TypeError(f"{type(self).name} can only have integer dtypes {type(self).dtypes}, not {obj.dtype}.")
-            if np.any(obj < 0) or np.any(obj >= type(self).order):
-                idxs = np.logical_or(obj < 0, obj >= type(self).order)
-                raise ValueError(f"{type(self).name} arrays must have values in 0 <= x < {type(self).order}, not {obj[idxs]}.")
+            if obj.dtype.kind == "u":
+                mask = obj >= type(self).order
+            else:
+                mask = np.empty(obj.shape, dtype=bool)
+                np.logical_or(obj < 0, obj >= type(self).order, out=mask)
+            if mask.any():
+                raise ValueError(f"{type(self).name} arrays must have values in 0 <= x < {type(self).order}, not {obj[mask]}.")
 
     def __getitem__(self, key):
         item = super().__getitem__(key)
         if np.isscalar(item):
             # Return scalar array elements as 0-dimension Galois field arrays. This enables Galois field arithmetic
-            # on scalars, which would otherwise be implemented using standard integer arithmetic.
-            item = self.__class__(item, dtype=self.dtype)
+            # on scalars, which would otherwise be implemented using standard integer arithmetic. The scalar came
+            # from a validated parent array, so a view cast suffices -- no need for full constructor validation.
+            item = np.asarray(item, dtype=self.dtype).view(type(self))
         return item
 
     def __setitem__(self, key, value):
+        # Arrays of the same Galois field class are known-valid by the class invariant, so skip
+        # re-validation. Object-dtype arrays still take the full path so their elements are
+        # re-coerced to python ints.
+        if isinstance(value, type(self)) and value.dtype != np.object_:
+            super().__setitem__(key, value)
+            return
         # Verify the values to be written to the Galois field array are in the field
         value = self._check_array_like_object(value)
         super().__setitem__(key, value)
 
     def __array_function__(self, func, types, args, kwargs):
-        if func in OVERRIDDEN_FUNCTIONS:
-            output = OVERRIDDEN_FUNCTIONS[func](*args, **kwargs)
+        handler = OVERRIDDEN_FUNCTIONS.get(func)
+        if handler is not None:
+            output = handler(*args, **kwargs)
 
         elif func in UNSUPPORTED_FUNCTIONS:
             raise NotImplementedError(f"The numpy function '{func.__name__}' is not supported on Galois field arrays. If you believe this function should be supported, please submit a GitHub issue at https://github.com/mhostetter/galois/issues.\n\nIf you'd like to perform this operation on the data (but not necessarily a Galois field array), you should first call `array = array.view(np.ndarray)` and then call the function.")
@@ -825,19 +975,21 @@ class GFArray(np.ndarray, metaclass=GFMeta):
 
     def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):  # pylint: disable=too-many-branches
         # print(ufunc, method, inputs, kwargs)
+        cls = type(self)
+        input_types = tuple(type(i) for i in inputs)
         meta = {}
-        meta["types"] = [type(inputs[i]) for i in range(len(inputs))]
-        meta["operands"] = list(range(len(inputs)))
-        if method in ["at", "reduceat"]:
-            # Remove the second argument for "at" ufuncs which is the indices list
-            meta["operands"].pop(1)
-        meta["field_operands"] = [i for i in meta["operands"] if isinstance(inputs[i], self.__class__)]
-        meta["non_field_operands"] = [i for i in meta["operands"] if not isinstance(inputs[i], self.__class__)]
-        meta["field"] = self.__class__
+        meta["operands"], meta["field_operands"], meta["non_field_operands"] = _classify_operands(cls, input_types, method in ["at", "reduceat"])
+        meta["field"] = cls
         meta["dtype"] = self.dtype
         # meta["ufuncs"] = self._ufuncs
 
-        if ufunc in OVERRIDDEN_UFUNCS:
+        if cls._ufunc_dispatch is None:  # pylint: disable=protected-access
+            # Bind the handler methods to this field class once, so each dispatch is a single
+            # dict lookup instead of two dict lookups plus a getattr
+            cls._ufunc_dispatch = {u: getattr(cls, name) for u, name in OVERRIDDEN_UFUNCS.items()}  # pylint: disable=protected-access
+
+        handler = cls._ufunc_dispatch.get(ufunc)  # pylint: disable=protected-access
+        if handler is not None:
             # Set all ufuncs with "casting" keyword argument to "unsafe" so we can cast unsigned integers
             # to integers. We know this is safe because we already verified the inputs.
             if method not in ["reduce", "accumulate", "at", "reduceat"]:
@@ -846,9 +998,9 @@ class GFArray(np.ndarray, metaclass=GFMeta):
             # Need to set the intermediate dtype for reduction operations or an error will be thrown. We
             # use the largest valid dtype for this field.
             if method in ["reduce"]:
-                kwargs["dtype"] = type(self).dtypes[-1]
+                kwargs["dtype"] = cls.dtypes[-1]
 
-            return getattr(type(self), OVERRIDDEN_UFUNCS[ufunc])(ufunc, method, inputs, kwargs, meta)
+            return handler(ufunc, method, inputs, kwargs, meta)
 
         elif ufunc in UNSUPPORTED_UFUNCS:
             raise NotImplementedError(f"The numpy ufunc '{ufunc.__name__}' is not supported on Galois field arrays. If you believe this ufunc should be supported, please submit a GitHub issue at https://github.com/mhostetter/galois/issues.")
@@ -869,9 +1021,10 @@ class GFArray(np.ndarray, metaclass=GFMeta):
     def __str__(self):
         return self.__repr__()
 
-    def __repr__(self):
+    def __repr__(self):  # pylint: disable=too-many-branches
         # pylint: disable=attribute-defined-outside-init
         formatter = {}
+        string = None
         if type(self).display_mode == "poly":
             formatter["int"] = self._print_poly
             formatter["object"] = self._print_poly
@@ -879,7 +1032,13 @@ class GFArray(np.ndarray, metaclass=GFMeta):
             nonzero_idxs = np.nonzero(self)
             if self.ndim > 1:
                 self._display_power_pre_width = 0 if nonzero_idxs[0].size == self.size else 1
-                max_power = np.max(np.log(self[nonzero_idxs]))
+                if type(self)._LOG is not None:
+                    # The column width is set by the largest discrete log, read from the LOG table
+                    max_power = int(np.max(type(self)._LOG[self.view(np.ndarray)[nonzero_idxs]]))  # pylint: disable=unsubscriptable-object
+                else:
+                    # No lookup tables are built in the "calculate" modes, so bound the width by
+                    # the largest possible power instead of computing logs just for the repr
+                    max_power = type(self).order - 2
                 if max_power > 1:
                     self._display_power_width = self._display_power_pre_width + 2 + len(str(max_power))
                 else:
@@ -890,14 +1049,24 @@ class GFArray(np.ndarray, metaclass=GFMeta):
             formatter["int"] = self._print_power
             formatter["object"] = self._print_power
         elif self.dtype == np.object_:
-            formatter["object"] = self._print_int
+            if self.size <= 1000:
+                formatter["object"] = self._print_int
+            else:
+                # The elements are python ints by the class invariant, so they print identically
+                # to _print_int without a formatter. A plain ndarray view must be printed, though:
+                # element access on the field array rewraps scalars as 0-D field arrays, which
+                # would nest a full GF(...) repr around every element. This skips the per-element
+                # python formatter call, which dominates the repr time of large arrays.
+                body = np.array2string(self.view(np.ndarray), separator=", ", prefix="GF(")
+                string = f"GF({body})"
 
         cls = type(self)
         class_name = cls.__name__
-        with np.printoptions(formatter=formatter):
-            cls.__name__ = "GF"  # Rename the class so very large fields don't create large indenting
-            string = super().__repr__()
-        cls.__name__ = class_name
+        if string is None:
+            with np.printoptions(formatter=formatter):
+                cls.__name__ = "GF"  # Rename the class so very large fields don't create large indenting
+                string = super().__repr__()
+            cls.__name__ = class_name
 
         if cls.degree == 1:
             order = "{}".format(cls.order)
@@ -918,12 +1087,23 @@ class GFArray(np.ndarray, metaclass=GFMeta):
         return "{:d}".format(int(element))
 
     def _print_poly(self, element):
+        element = int(element)
+        cache = type(self)._poly_str_cache
+        if cache is not None and element in cache:
+            return cache[element]
         poly = integer_to_poly(element, type(self).characteristic)
         poly_var = "α" if type(self).primitive_element == type(self).characteristic else "x"
-        return poly_to_str(poly, poly_var=poly_var)
+        string = poly_to_str(poly, poly_var=poly_var)
+        if cache is not None:
+            cache[element] = string
+        return string
 
     def _print_power(self, element):
-        if element == 0:
+        element = int(element)
+        cache = type(self)._power_str_cache
+        if cache is not None and element in cache:
+            s = cache[element]
+        elif element == 0:
             s = "-∞"
         else:
             power = type(self)._ufuncs["log"](element)
@@ -933,9 +1113,11 @@ class GFArray(np.ndarray, metaclass=GFMeta):
                 s = "α"
             else:
                 s = "1"
+            if cache is not None:
+                cache[element] = s
 
-            if self._display_power_pre_width:
-                s = " " + s
+        if element > 0 and self._display_power_pre_width:
+            s = " " + s
 
         if self._display_power_width:
             return s + " "*(self._display_power_width - len(s))
@@ -944,26 +1126,34 @@ class GFArray(np.ndarray, metaclass=GFMeta):
 
     @classmethod
     def _poly_eval(cls, coeffs, x):
-        coeffs = cls(coeffs)  # Convert coefficient into the field
-        coeffs = coeffs.view(np.ndarray)  # View cast to normal integers so ufunc_poly_eval call uses normal arithmetic
+        if not isinstance(coeffs, cls):
+            coeffs = cls(coeffs)  # Convert coefficients into the field (checks the values are in the field)
         coeffs = np.atleast_1d(coeffs)
-        if coeffs.size == 1:
-            # TODO: Why must coeffs have atleast 2 elements otherwise it will be converted to a scalar, not 1d array?
-            coeffs = np.insert(coeffs, 0, 0)
 
-        x = cls(x)  # Convert evaluation values into the field (checks that values are in the field)
-        x = x.view(np.ndarray)  # View cast to normal integers so ufunc_poly_eval call uses normal arithmetic
+        if not isinstance(x, cls):
+            x = cls(x)  # Convert evaluation values into the field (checks the values are in the field)
         x = np.atleast_1d(x)
 
-        if cls.dtypes[-1] == np.object_:
-            # For object dtypes, call the vectorized classmethod
-            y = cls._ufuncs["poly_eval"](coeffs=coeffs, values=x)  # pylint: disable=not-callable
+        if coeffs.size == 1:
+            # A constant polynomial, broadcast the coefficient without invoking the gufunc
+            y = cls._view_without_verification(np.full(x.shape, int(coeffs[0]), dtype=x.dtype))
+        elif coeffs.size == 2:
+            # An affine polynomial, two field ufunc calls beat the gufunc setup
+            y = coeffs[0]*x + coeffs[1]
         else:
-            # For integer dtypes, call the JIT-compiled gufunc
-            y = np.copy(x)
-            cls._ufuncs["poly_eval"](coeffs, x, y, casting="unsafe")  # pylint: disable=not-callable
+            # View cast to normal integers so the poly_eval ufunc call uses normal arithmetic
+            coeffs = coeffs.view(np.ndarray)
+            x = x.view(np.ndarray)
+            if cls.dtypes[-1] == np.object_:
+                # For object dtypes, call the vectorized classmethod
+                y = cls._ufuncs["poly_eval"](coeffs=coeffs, values=x)  # pylint: disable=not-callable
+            else:
+                # For integer dtypes, call the JIT-compiled gufunc. The gufunc writes every output
+                # element, so an uninitialized buffer suffices -- no need to copy `x` into it.
+                y = np.empty_like(x)
+                cls._ufuncs["poly_eval"](coeffs, x, y, casting="unsafe")  # pylint: disable=not-callable
+            y = cls(y)
 
-        y = cls(y)
         if y.size == 1:
             y = y[0]
 
@@ -134,7 +134,7 @@ def lu_decompose(A):
     field = type(A)
     n = A.shape[0]
     Ai = np.copy(A)
-    L = field.Identity(n)
+    L = field.Identity(n).copy()  # Identity() may return a read-only cached matrix
 
     for i in range(0, n-1):
         if Ai[i,i] == 0:
@@ -155,7 +155,7 @@ def lup_decompose(A):
     n = A.shape[0]
     Ai = np.copy(A)
     L = field.Zeros((n,n))
-    P = field.Identity(n)
+    P = field.Identity(n).copy()  # Identity() may return a read-only cached matrix
 
     for i in range(0, n-1):
         if Ai[i,i] == 0:
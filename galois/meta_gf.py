@@ -35,6 +35,18 @@ class GFMeta(UfuncMixin):
         cls._ufunc_target = None
         cls._display_mode = "int"
 
+        # Cache the `dtypes` property and its set form (for O(1) membership tests in `_get_dtype` and `astype`)
+        cls._dtypes = None
+        cls._dtype_set = None
+        if cls._order is not None:
+            cls._dtype_set = frozenset(np.dtype(d) for d in cls.dtypes)
+
+        # Per-element repr string caches, populated lazily by `_print_poly` and `_print_power`.
+        # Only small fields are cached since each can grow to `order` entries.
+        cache_strings = cls._order is not None and cls._order <= 4096
+        cls._poly_str_cache = {} if cache_strings else None
+        cls._power_str_cache = {} if cache_strings else None
+
     def __str__(cls):
         return f"<class 'numpy.ndarray over {cls.name}'>"
 
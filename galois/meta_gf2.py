@@ -95,10 +95,12 @@ class GF2Meta(GFMeta):
 
     @property
     def dtypes(cls):
-        d = [dtype for dtype in DTYPES if np.iinfo(dtype).max >= cls.order - 1]
-        if len(d) == 0:
-            d = [np.object_]
-        return d
+        if cls._dtypes is None:
+            d = [dtype for dtype in DTYPES if np.iinfo(dtype).max >= cls.order - 1]
+            if len(d) == 0:
+                d = [np.object_]
+            cls._dtypes = d
+        return cls._dtypes
 
     @property
     def default_ufunc_mode(cls):
@@ -109,8 +111,8 @@ class GF2Meta(GFMeta):
         CHARACTERISTIC = cls._characteristic
 
         # JIT-compile add and multiply routines for reference in polynomial evaluation routine
-        ADD_JIT = numba.jit("int64(int64, int64)", nopython=True)(_add_calculate)
-        MULTIPLY_JIT = numba.jit("int64(int64, int64)", nopython=True)(_multiply_calculate)
+        ADD_JIT = numba.jit("int64(int64, int64)", nopython=True, nogil=True)(_add_calculate)
+        MULTIPLY_JIT = numba.jit("int64(int64, int64)", nopython=True, nogil=True)(_multiply_calculate)
 
         kwargs = {"nopython": True, "target": target}
         if target == "cuda":
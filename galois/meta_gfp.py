@@ -1,7 +1,9 @@
+import functools
+
 import numba
 import numpy as np
 
-from .algorithm import gcd, _gcd_jit
+from .algorithm import gcd
 from .dtypes import DTYPES
 from .meta_gf import GFMeta
 from .poly import Poly
@@ -9,12 +11,21 @@ from .poly import Poly
 # Field attribute globals
 CHARACTERISTIC = None  # The prime characteristic `p` of the Galois field
 ORDER = None  # The field's order `p^m`
+ORDER_INV = None  # Precomputed 1/order for float-reciprocal modular reduction
 PRIMITIVE_ELEMENT = None  # The field's primitive element
 
+# Baby-Step Giant-Step tables for the discrete log, built at JIT-compile time
+BSGS_BABY_STEPS = None  # Number of baby steps, ceil(sqrt(order - 1))
+BSGS_GIANT_STEPS = None  # Number of giant steps, ceil((order - 1) / baby steps)
+BSGS_VALUES = None  # The baby-step values α^j for j in [0, baby steps), sorted for binary search
+BSGS_LOGS = None  # The exponent j of each sorted baby-step value
+ALPHA_INV_BABY = None  # The giant-step multiplier α^-(baby steps)
+
 # Placeholder functions to be replaced by JIT-compiled function
 ADD_JIT = lambda x, y: x + y
 MULTIPLY_JIT = lambda x, y: x * y
 MULTIPLICATIVE_INVERSE_JIT = lambda x: 1 / x
+REDUCE_JIT = lambda x: x % ORDER
 
 
 class GFpMeta(GFMeta):
@@ -40,22 +51,89 @@ class GFpMeta(GFMeta):
 
     @property
     def dtypes(cls):
-        max_dtype = DTYPES[-1]
-        d = [dtype for dtype in DTYPES if np.iinfo(dtype).max >= cls.order - 1 and np.iinfo(max_dtype).max >= (cls.order - 1)**2]
-        if len(d) == 0:
-            d = [np.object_]
-        return d
+        if cls._dtypes is None:
+            max_dtype = DTYPES[-1]
+            d = [dtype for dtype in DTYPES if np.iinfo(dtype).max >= cls.order - 1 and np.iinfo(max_dtype).max >= (cls.order - 1)**2]
+            if len(d) == 0:
+                d = [np.object_]
+            cls._dtypes = d
+        return cls._dtypes
+
+    def _build_lookup_tables(cls):
+        # For GF(p) the element arithmetic is plain modular integer arithmetic, so the tables can
+        # be built with vectorized numpy instead of dispatching _multiply_python/_add_python per
+        # element through the interpreter
+        order = int(cls.order)
+        alpha = cls._primitive_element_int
+        dtype = np.int64
+        if order > np.iinfo(dtype).max:
+            raise RuntimeError(f"Cannot build lookup tables for {cls.name} since the elements cannot be represented with dtype {dtype}.")
+
+        # Factor each exponent as i = j*B + r with B = ceil(sqrt(order)), so EXP is the raveled
+        # outer product of the giant steps α^(j*B) and the baby steps α^r. Only the two O(sqrt(p))
+        # factor tables need a python loop. The products fit in an int64 because "jit-lookup" mode
+        # requires an integer dtype, which the `dtypes` property caps at (order - 1)^2 <= int64 max.
+        B = int(np.sqrt(order)) + 1
+        baby = np.empty(B, dtype=dtype)
+        x = 1
+        for r in range(B):
+            baby[r] = x
+            x = (x * alpha) % order
+        num_giant = (order - 1) // B + 1
+        giant_multiplier = pow(alpha, B, order)
+        giant = np.empty(num_giant, dtype=dtype)
+        x = 1
+        for j in range(num_giant):
+            giant[j] = x
+            x = (x * giant_multiplier) % order
+        exp = np.multiply.outer(giant, baby).ravel()[0:order] % order
+
+        cls._EXP = np.zeros(2*order, dtype=dtype)
+        cls._EXP[0:order] = exp
+
+        # Invert EXP with a scatter, LOG[α^i] = i, skipping i = order - 1 because EXP[0] == EXP[order - 1]
+        cls._LOG = np.zeros(order, dtype=dtype)
+        cls._LOG[exp[0:order - 1]] = np.arange(0, order - 1)
+
+        # Compute the Zech log lookup table. 1 + α^i only wraps when α^i == p - 1, so a compare
+        # replaces the modulo.
+        one_plus_element = exp + 1
+        one_plus_element[one_plus_element == order] = 0
+        cls._ZECH_LOG = cls._LOG[one_plus_element]
+
+        cls._finish_lookup_tables()
 
     def _compile_jit_calculate(cls, target):
-        global CHARACTERISTIC, ORDER, PRIMITIVE_ELEMENT, ADD_JIT, MULTIPLY_JIT, MULTIPLICATIVE_INVERSE_JIT
+        global CHARACTERISTIC, ORDER, ORDER_INV, PRIMITIVE_ELEMENT, ADD_JIT, MULTIPLY_JIT, MULTIPLICATIVE_INVERSE_JIT, REDUCE_JIT
+        global BSGS_BABY_STEPS, BSGS_GIANT_STEPS, BSGS_VALUES, BSGS_LOGS, ALPHA_INV_BABY
         CHARACTERISTIC = cls.characteristic
         ORDER = cls.order
+        ORDER_INV = 1.0 / cls.order
         PRIMITIVE_ELEMENT = int(cls.primitive_element)  # Convert from field element to integer
 
-        # JIT-compile add, multiply, and multiplicative inverse routines for reference in polynomial evaluation routine
-        ADD_JIT = numba.jit("int64(int64, int64)", nopython=True)(_add_calculate)
-        MULTIPLY_JIT = numba.jit("int64(int64, int64)", nopython=True)(_multiply_calculate)
-        MULTIPLICATIVE_INVERSE_JIT = numba.jit("int64(int64)", nopython=True)(_multiplicative_inverse_calculate)
+        # Build the Baby-Step Giant-Step tables for the discrete log, with m = ceil(sqrt(order - 1))
+        # baby steps α^j. Sorted values with a parallel exponent table allow a binary search per
+        # giant step inside the JIT-compiled ufunc.
+        m = int(np.sqrt(cls.order - 1)) + 1
+        baby_steps = np.empty(m, dtype=np.int64)
+        x = 1
+        for j in range(m):
+            baby_steps[j] = x
+            x = (x * PRIMITIVE_ELEMENT) % cls.order
+        idxs = np.argsort(baby_steps)
+        BSGS_BABY_STEPS = m
+        BSGS_GIANT_STEPS = (cls.order - 2) // m + 1
+        BSGS_VALUES = baby_steps[idxs]
+        BSGS_LOGS = idxs.astype(np.int64)
+        alpha_inv = pow(PRIMITIVE_ELEMENT, cls.order - 2, cls.order)
+        ALPHA_INV_BABY = pow(alpha_inv, m, cls.order)
+
+        # JIT-compile the modular reduction, add, multiply, and multiplicative inverse routines for
+        # reference in the other arithmetic routines
+        REDUCE_JIT = numba.jit("int64(int64)", nopython=True, nogil=True)(_reduce_calculate)
+        ADD_JIT = numba.jit("int64(int64, int64)", nopython=True, nogil=True)(_add_calculate)
+        MULTIPLY_JIT = numba.jit("int64(int64, int64)", nopython=True, nogil=True)(_multiply_calculate)
+        MULTIPLICATIVE_INVERSE_JIT = numba.jit("int64(int64)", nopython=True, nogil=True)(_multiplicative_inverse_calculate)
 
         kwargs = {"nopython": True, "target": target}
         if target == "cuda":
@@ -71,7 +149,56 @@ class GFpMeta(GFMeta):
         cls._ufuncs["scalar_multiply"] = numba.vectorize(["int64(int64, int64)"], **kwargs)(_scalar_multiply_calculate)
         cls._ufuncs["power"] = numba.vectorize(["int64(int64, int64)"], **kwargs)(_power_calculate)
         cls._ufuncs["log"] = numba.vectorize(["int64(int64)"], **kwargs)(_log_calculate)
-        cls._ufuncs["poly_eval"] = numba.guvectorize([(numba.int64[:], numba.int64[:], numba.int64[:])], "(n),(m)->(m)", **kwargs)(_poly_eval_calculate)
+        if target == "parallel":
+            # guvectorize with target="parallel" only splits work across the gufunc's outer loop,
+            # which has a single iteration here since `values` maps to the core dimension. Each
+            # evaluation point is independent, so parallelize the inner Horner loop with prange
+            # instead, behind a wrapper that presents the same call signature as the gufunc. The
+            # compiled kernel is bound to this class with a partial -- reading it from a module
+            # global at call time would pick up whichever field compiled last.
+            poly_eval_parallel_jit = numba.jit("int64[:](int64[:], int64[:])", nopython=True, nogil=True, parallel=True)(_poly_eval_calculate_parallel)
+            cls._ufuncs["poly_eval"] = functools.partial(_poly_eval_parallel, poly_eval_parallel_jit)
+        else:
+            cls._ufuncs["poly_eval"] = numba.guvectorize([(numba.int64[:], numba.int64[:], numba.int64[:])], "(n),(m)->(m)", **kwargs)(_poly_eval_calculate)
+
+    ###############################################################################
+    # Ufunc routines using numpy arithmetic
+    ###############################################################################
+
+    # For GF(p), addition, subtraction, and negation reduce with at most one conditional
+    # add/subtract of the order, so they can run through numpy's SIMD-backed C loops (one
+    # arithmetic pass plus one masked correction pass) instead of the numba kernels.
+    # Multiplication keeps the jit kernel, whose float-reciprocal reduction beats a numpy
+    # expression built on the hardware modulo.
+
+    def _numpy_ufunc_viable(cls, method, kwargs):
+        return method == "__call__" and cls._ufunc_mode == "jit-calculate" and set(kwargs).issubset({"casting"})
+
+    def _ufunc_add(cls, ufunc, method, inputs, kwargs, meta):
+        if not cls._numpy_ufunc_viable(method, kwargs):
+            return super()._ufunc_add(ufunc, method, inputs, kwargs, meta)
+        cls._verify_operands_in_same_field(ufunc, inputs, meta)
+        inputs, kwargs = cls._view_inputs_as_ndarray(inputs, kwargs)
+        output = np.asarray(np.add(inputs[0], inputs[1], dtype=np.int64, casting="unsafe"))
+        np.subtract(output, cls.order, out=output, where=output >= cls.order)  # pylint: disable=comparison-with-callable
+        return cls._view_output_as_field(output, meta["field"], meta["dtype"])
+
+    def _ufunc_subtract(cls, ufunc, method, inputs, kwargs, meta):
+        if not cls._numpy_ufunc_viable(method, kwargs):
+            return super()._ufunc_subtract(ufunc, method, inputs, kwargs, meta)
+        cls._verify_operands_in_same_field(ufunc, inputs, meta)
+        inputs, kwargs = cls._view_inputs_as_ndarray(inputs, kwargs)
+        output = np.asarray(np.subtract(inputs[0], inputs[1], dtype=np.int64, casting="unsafe"))
+        np.add(output, cls.order, out=output, where=output < 0)
+        return cls._view_output_as_field(output, meta["field"], meta["dtype"])
+
+    def _ufunc_negative(cls, ufunc, method, inputs, kwargs, meta):
+        if not cls._numpy_ufunc_viable(method, kwargs):
+            return super()._ufunc_negative(ufunc, method, inputs, kwargs, meta)
+        inputs, kwargs = cls._view_inputs_as_ndarray(inputs, kwargs)
+        output = np.asarray(np.subtract(cls.order, inputs[0], dtype=np.int64, casting="unsafe"))
+        np.subtract(output, cls.order, out=output, where=output == cls.order)  # -0 == 0  # pylint: disable=comparison-with-callable
+        return cls._view_output_as_field(output, meta["field"], meta["dtype"])
 
     ###############################################################################
     # Pure python arithmetic methods
@@ -115,14 +242,31 @@ def _add_calculate(a, b):  # pragma: no cover
 
 
 def _subtract_calculate(a, b):  # pragma: no cover
+    # The arithmetic right shift produces an all-ones mask exactly when a - b is negative, so the
+    # sign fix-up is a branchless add of ORDER or 0
     c = a - b
-    if c < 0:
-        c += ORDER
-    return c
+    return c + (ORDER & (c >> 63))
+
+
+def _reduce_calculate(x):  # pragma: no cover
+    """
+    Barrett-style reduction with a precomputed float reciprocal, instead of the hardware `%`
+    (a 20+ cycle integer division). The quotient estimate `q = int(x * (1/order))` is within 1 of
+    floor(x/order) for x <= (order - 1)^2 (guaranteed to fit in an int64 by the `dtypes` property),
+    so at most one corrective add/subtract is needed. The corrections compile to branchless
+    conditional moves, which lets calling loops autovectorize.
+    """
+    q = int(x * ORDER_INV)
+    r = x - q*ORDER
+    if r >= ORDER:
+        r -= ORDER
+    if r < 0:
+        r += ORDER
+    return r
 
 
 def _multiply_calculate(a, b):  # pragma: no cover
-    return (a * b) % ORDER
+    return REDUCE_JIT(a * b)
 
 
 def _divide_calculate(a, b):  # pragma: no cover
@@ -134,32 +278,51 @@ def _divide_calculate(a, b):  # pragma: no cover
 
 
 def _additive_inverse_calculate(a):  # pragma: no cover
-    if a == 0:
-        return 0
-    else:
-        return ORDER - a
+    # Same branchless sign fix-up as _subtract_calculate, computing 0 - a
+    c = -a
+    return c + (ORDER & (c >> 63))
 
 
 def _multiplicative_inverse_calculate(a):  # pragma: no cover
-    a_inv = _gcd_jit(a, ORDER)[1]
-    return a_inv % ORDER
+    """
+    By Fermat's little theorem, a^-1 = a^(p - 2) mod p for prime p. The exponentiation uses the
+    same left-to-right square-and-multiply as _power_calculate and, unlike the extended Euclidean
+    algorithm, needs no tuple return or sign normalization.
+    """
+    power = ORDER - 2
+
+    # Find the index of the MSB of `power`
+    bit = 1
+    while bit <= power >> 1:
+        bit <<= 1
+
+    result = a
+    bit >>= 1
+    while bit > 0:
+        result = MULTIPLY_JIT(result, result)
+        if power & bit:
+            result = MULTIPLY_JIT(result, a)
+        bit >>= 1
+
+    return result
 
 
 def _scalar_multiply_calculate(a, multiple):  # pragma: no cover
-    return (a * multiple) % ORDER
+    # Reduce the scalar multiple first so the product fits in an int64 and can use the
+    # float-reciprocal reduction
+    multiple = multiple % ORDER
+    return REDUCE_JIT(a * multiple)
 
 
 def _power_calculate(a, power):  # pragma: no cover
     """
-    Square and Multiply Algorithm
-
-    a^13 = (1) * (a)^13
-         = (a) * (a)^12
-         = (a) * (a^2)^6
-         = (a) * (a^4)^3
-         = (a * a^4) * (a^4)^2
-         = (a * a^4) * (a^8)
-         = result_m * result_s
+    Left-to-Right Square and Multiply Algorithm, scanning the exponent bits MSB -> LSB
+
+    a^13 = a^0b1101
+         = ((a^2 * a)^2)^2 * a
+
+    One squaring per bit below the MSB plus one multiply per set bit, about half the
+    multiplies of the right-to-left variant.
     """
     # NOTE: The a == 0 and b < 0 condition will be caught outside of the the ufunc and raise ZeroDivisonError
     if power == 0:
@@ -168,42 +331,66 @@ def _power_calculate(a, power):  # pragma: no cover
         a = MULTIPLICATIVE_INVERSE_JIT(a)
         power = abs(power)
 
-    result_s = a  # The "squaring" part
-    result_m = 1  # The "multiplicative" part
-
-    while power > 1:
-        if power % 2 == 0:
-            result_s = MULTIPLY_JIT(result_s, result_s)
-            power //= 2
-        else:
-            result_m = MULTIPLY_JIT(result_m, result_s)
-            power -= 1
+    # Find the highest set bit of the exponent
+    bit = 1
+    while bit <= power >> 1:
+        bit <<= 1
 
-    result = MULTIPLY_JIT(result_m, result_s)
+    result = a  # The MSB of the exponent is always set
+    bit >>= 1
+    while bit > 0:
+        result = MULTIPLY_JIT(result, result)
+        if power & bit:
+            result = MULTIPLY_JIT(result, a)
+        bit >>= 1
 
     return result
 
 
 def _log_calculate(beta):  # pragma: no cover
     """
-    TODO: Replace this with more efficient algorithm
+    Baby-Step Giant-Step Algorithm
 
-    alpha in GF(p^m) and generates field
-    beta in GF(p^m)
+    alpha in GF(p) and generates field
+    beta in GF(p)
 
     gamma = log_primitive_element(beta), such that: alpha^gamma = beta
+
+    Writing gamma = i*m + j with m = ceil(sqrt(p - 1)), then beta * α^-(i*m) = α^j. Each giant
+    step multiplies by α^-m and binary-searches the sorted baby-step table α^j for j in [0, m),
+    for O(sqrt(p) log p) work instead of the O(p) naive scan.
     """
-    # Naive algorithm
-    result = 1
-    for i in range(0, ORDER-1):
-        if result == beta:
-            break
-        result = MULTIPLY_JIT(result, PRIMITIVE_ELEMENT)
-    return i
+    gamma = beta
+    for i in range(BSGS_GIANT_STEPS):
+        j = np.searchsorted(BSGS_VALUES, gamma)
+        if j < BSGS_BABY_STEPS and BSGS_VALUES[j] == gamma:
+            return i*BSGS_BABY_STEPS + BSGS_LOGS[j]
+        gamma = MULTIPLY_JIT(gamma, ALPHA_INV_BABY)
+    return 0  # Unreachable, beta == 0 is caught before the ufunc is invoked
 
 
 def _poly_eval_calculate(coeffs, values, results):  # pragma: no cover
+    # The Horner step is fused into a single reduction. Its operand is at most
+    # (order - 1) + (order - 1)^2 = (order - 1)*order, which fits in an int64 for every GF(p)
+    # class the `dtypes` property permits, and is still within REDUCE_JIT's correction range.
     for i in range(values.size):
         results[i] = coeffs[0]
         for j in range(1, coeffs.size):
-            results[i] = ADD_JIT(coeffs[j], MULTIPLY_JIT(results[i], values[i]))
+            results[i] = REDUCE_JIT(coeffs[j] + results[i] * values[i])
+
+
+def _poly_eval_parallel(poly_eval_parallel_jit, coeffs, values, results, casting="unsafe"):  # pylint: disable=unused-argument
+    # Assign through the original `results` array: if it isn't C-contiguous, reshape(-1) returns
+    # a copy and writes into it would be lost
+    output = poly_eval_parallel_jit(coeffs.astype(np.int64), values.reshape(-1).astype(np.int64))
+    results[...] = output.reshape(results.shape)
+
+
+def _poly_eval_calculate_parallel(coeffs, values):  # pragma: no cover
+    results = np.empty(values.size, dtype=np.int64)
+    for i in numba.prange(values.size):  # pylint: disable=not-an-iterable
+        r = coeffs[0]
+        for j in range(1, coeffs.size):
+            r = REDUCE_JIT(coeffs[j] + r * values[i])  # Fused Horner step, see _poly_eval_calculate
+        results[i] = r
+    return results
@@ -44,11 +44,13 @@ class GFpmMeta(GFMeta):
 
     @property
     def dtypes(cls):
-        max_dtype = DTYPES[-1]
-        d = [dtype for dtype in DTYPES if np.iinfo(dtype).max >= cls.order - 1 and np.iinfo(max_dtype).max >= (cls.order - 1)**2]
-        if len(d) == 0:
-            d = [np.object_]
-        return d
+        if cls._dtypes is None:
+            max_dtype = DTYPES[-1]
+            d = [dtype for dtype in DTYPES if np.iinfo(dtype).max >= cls.order - 1 and np.iinfo(max_dtype).max >= (cls.order - 1)**2]
+            if len(d) == 0:
+                d = [np.object_]
+            cls._dtypes = d
+        return cls._dtypes
 
     def _compile_jit_calculate(cls, target):
         global CHARACTERISTIC, DEGREE, ORDER, PRIMITIVE_ELEMENT, IRREDUCIBLE_POLY, DTYPE, INT_TO_POLY_JIT, POLY_TO_INT_JIT, ADD_JIT, MULTIPLY_JIT, MULTIPLICATIVE_INVERSE_JIT
@@ -62,13 +64,13 @@ class GFpmMeta(GFMeta):
         IRREDUCIBLE_POLY = cls._irreducible_poly.coeffs.view(np.ndarray)
         DTYPE = cls.dtypes[-1]  # pylint: disable=unsubscriptable-object
 
-        INT_TO_POLY_JIT = numba.jit("int64[:](int64)", nopython=True)(_int_to_poly)
-        POLY_TO_INT_JIT = numba.jit("int64(int64[:])", nopython=True)(_poly_to_int)
+        INT_TO_POLY_JIT = numba.jit("int64[:](int64)", nopython=True, nogil=True)(_int_to_poly)
+        POLY_TO_INT_JIT = numba.jit("int64(int64[:])", nopython=True, nogil=True)(_poly_to_int)
 
         # JIT-compile add,  multiply, and multiplicative inverse routines for reference in polynomial evaluation routine
-        ADD_JIT = numba.jit("int64(int64, int64)", nopython=True)(_add_calculate)
-        MULTIPLY_JIT = numba.jit("int64(int64, int64)", nopython=True)(_multiply_calculate)
-        MULTIPLICATIVE_INVERSE_JIT = numba.jit("int64(int64)", nopython=True)(_multiplicative_inverse_calculate)
+        ADD_JIT = numba.jit("int64(int64, int64)", nopython=True, nogil=True)(_add_calculate)
+        MULTIPLY_JIT = numba.jit("int64(int64, int64)", nopython=True, nogil=True)(_multiply_calculate)
+        MULTIPLICATIVE_INVERSE_JIT = numba.jit("int64(int64)", nopython=True, nogil=True)(_multiplicative_inverse_calculate)
 
         kwargs = {"nopython": True, "target": target}
         if target == "cuda":
@@ -345,15 +347,13 @@ def _scalar_multiply_calculate(a, multiple):  # pragma: no cover
 
 def _power_calculate(a, power):  # pragma: no cover
     """
-    Square and Multiply Algorithm
-
-    a^13 = (1) * (a)^13
-         = (a) * (a)^12
-         = (a) * (a^2)^6
-         = (a) * (a^4)^3
-         = (a * a^4) * (a^4)^2
-         = (a * a^4) * (a^8)
-         = result_m * result_s
+    Left-to-Right Square and Multiply Algorithm, scanning the exponent bits MSB -> LSB
+
+    a^13 = a^0b1101
+         = ((a^2 * a)^2)^2 * a
+
+    One squaring per bit below the MSB plus one multiply per set bit, about half the
+    multiplies of the right-to-left variant.
     """
     # NOTE: The a == 0 and b < 0 condition will be caught outside of the the ufunc and raise ZeroDivisonError
     if power == 0:
@@ -362,18 +362,18 @@ def _power_calculate(a, power):  # pragma: no cover
         a = MULTIPLICATIVE_INVERSE_JIT(a)
         power = abs(power)
 
-    result_s = a  # The "squaring" part
-    result_m = 1  # The "multiplicative" part
-
-    while power > 1:
-        if power % 2 == 0:
-            result_s = MULTIPLY_JIT(result_s, result_s)
-            power //= 2
-        else:
-            result_m = MULTIPLY_JIT(result_m, result_s)
-            power -= 1
-
-    result = MULTIPLY_JIT(result_m, result_s)
+    # Find the highest set bit of the exponent
+    bit = 1
+    while bit <= power >> 1:
+        bit <<= 1
+
+    result = a  # The MSB of the exponent is always set
+    bit >>= 1
+    while bit > 0:
+        result = MULTIPLY_JIT(result, result)
+        if power & bit:
+            result = MULTIPLY_JIT(result, a)
+        bit >>= 1
 
     return result
 
@@ -11,11 +11,33 @@ EXP = []  # EXP[i] = α^i
 LOG = []  # LOG[i] = x, such that α^x = i
 ZECH_LOG = []  # ZECH_LOG[i] = log(1 + α^i)
 ZECH_E = None  # α^ZECH_E = -1, ZECH_LOG[ZECH_E] = -Inf
+MUL = []  # MUL[a, b] = a * b, only built for small orders
+
+# Largest field order for which the full order×order multiplication table is built. The table
+# then stays cache-resident and a multiply is a single 2-D gather instead of the three dependent
+# EXP/LOG loads.
+MUL_TABLE_MAX_ORDER = 1024
 
 ADD_JIT = lambda x, y: x + y
 MULTIPLY_JIT = lambda x, y: x * y
 
 
+def _table_dtype(order):
+    """
+    The smallest unsigned dtype that can store a field element. Storing the lookup tables at this
+    width (instead of int64) keeps them cache-resident for small and medium fields, which is where
+    the lookup kernels spend their time.
+    """
+    if order - 1 <= np.iinfo(np.uint8).max:
+        return np.dtype(np.uint8)
+    elif order - 1 <= np.iinfo(np.uint16).max:
+        return np.dtype(np.uint16)
+    elif order - 1 <= np.iinfo(np.uint32).max:
+        return np.dtype(np.uint32)
+    else:
+        return np.dtype(np.int64)
+
+
 class UfuncMixin(type):
     """
     A mixin class that provides the basics for compiling ufuncs.
@@ -27,6 +49,7 @@ class UfuncMixin(type):
         cls._EXP = None
         cls._LOG = None
         cls._ZECH_LOG = None
+        cls._MUL = None
         cls._ufuncs = {}
 
         # Integer representations of the field's primitive element and primitive polynomial to be used in the
@@ -103,22 +126,52 @@ class UfuncMixin(type):
             one_plus_element = cls._add_python(1, cls._EXP[i])
             cls._ZECH_LOG[i] = cls._LOG[one_plus_element]
 
+        cls._finish_lookup_tables()
+
+    def _finish_lookup_tables(cls):
+        """
+        Verify the freshly-built EXP/LOG tables and derive the secondary tables from them.
+        """
+        order = cls.order
+
         if not cls._EXP[order - 1] == 1:
             raise RuntimeError(f"The anti-log lookup table for {cls.name} is not cyclic with size {order - 1}, which means the primitive element {cls.primitive_element} does not have multiplicative order {order - 1} and therefore isn't a multiplicative generator for {cls.name}.")
-        if not len(set(cls._EXP[0:order - 1])) == order - 1:
+        if not np.unique(cls._EXP[0:order - 1]).size == order - 1:
             raise RuntimeError(f"The anti-log lookup table for {cls.name} is not unique, which means the primitive element {cls.primitive_element} has order less than {order - 1} and is not a multiplicative generator of {cls.name}.")
-        if not len(set(cls._LOG[1:order])) == order - 1:
+        if not np.unique(cls._LOG[1:order]).size == order - 1:
             raise RuntimeError(f"The log lookup table for {cls.name} is not unique.")
 
         # Double the EXP table to prevent computing a `% (order - 1)` on every multiplication lookup
         cls._EXP[order:2*order] = cls._EXP[1:1 + order]
 
+        # Likewise replicate the ZECH_LOG table (which has period `order - 1`) so the subtraction
+        # lookup can index with the α^ZECH_E offset applied without a `% (order - 1)`
+        cls._ZECH_LOG = np.concatenate((cls._ZECH_LOG[0:order - 1], cls._ZECH_LOG[0:order - 1]))
+
+        if order <= MUL_TABLE_MAX_ORDER:
+            # Build the full multiplication table from the log/anti-log tables, MUL[a, b] = α^(log(a) + log(b)).
+            # The log sums index into the doubled EXP table directly. Row and column 0 are fixed up
+            # afterwards since LOG[0] is a sentinel.
+            cls._MUL = cls._EXP[cls._LOG[:, np.newaxis] + cls._LOG[np.newaxis, :]]
+            cls._MUL[0, :] = 0
+            cls._MUL[:, 0] = 0
+
+        # Downcast the tables to the smallest dtype that can store a field element. The JIT
+        # kernels widen table loads back to int64 before any index arithmetic, so the narrow
+        # storage can't overflow.
+        dtype = _table_dtype(order)
+        cls._EXP = cls._EXP.astype(dtype)
+        cls._LOG = cls._LOG.astype(dtype)
+        cls._ZECH_LOG = cls._ZECH_LOG.astype(dtype)
+        if cls._MUL is not None:
+            cls._MUL = cls._MUL.astype(dtype)
+
     def _compile_jit_lookup(cls, target):
         """
         A method to JIT-compile the standard lookup arithmetic for any field. The functions that are
         JIT compiled are at the bottom of this file.
         """
-        global CHARACTERISTIC, ORDER, EXP, LOG, ZECH_LOG, ZECH_E, ADD_JIT, MULTIPLY_JIT
+        global CHARACTERISTIC, ORDER, EXP, LOG, ZECH_LOG, ZECH_E, MUL, ADD_JIT, MULTIPLY_JIT
 
         # Build the lookup tables if they don't exist
         if cls._EXP is None:
@@ -135,9 +188,15 @@ class UfuncMixin(type):
         else:
             ZECH_E = (cls.order - 1) // 2
 
+        # Small fields have a full multiplication table, making a multiply a single gather
+        multiply_lookup = _multiply_lookup
+        if cls._MUL is not None:
+            MUL = cls._MUL
+            multiply_lookup = _multiply_table_lookup
+
         # JIT-compile add and multiply routines for reference in other routines
-        ADD_JIT = numba.jit("int64(int64, int64)", nopython=True)(_add_lookup)
-        MULTIPLY_JIT = numba.jit("int64(int64, int64)", nopython=True)(_multiply_lookup)
+        ADD_JIT = numba.jit("int64(int64, int64)", nopython=True, nogil=True)(_add_lookup)
+        MULTIPLY_JIT = numba.jit("int64(int64, int64)", nopython=True, nogil=True)(multiply_lookup)
 
         kwargs = {"nopython": True, "target": target}
         if target == "cuda":
@@ -149,7 +208,7 @@ class UfuncMixin(type):
         # Create numba JIT-compiled ufuncs using the *current* EXP, LOG, and MUL_INV lookup tables
         cls._ufuncs["add"] = numba.vectorize(["int64(int64, int64)"], **kwargs)(_add_lookup)
         cls._ufuncs["subtract"] = numba.vectorize(["int64(int64, int64)"], **kwargs)(_subtract_lookup)
-        cls._ufuncs["multiply"] = numba.vectorize(["int64(int64, int64)"], **kwargs)(_multiply_lookup)
+        cls._ufuncs["multiply"] = numba.vectorize(["int64(int64, int64)"], **kwargs)(multiply_lookup)
         cls._ufuncs["divide"] = numba.vectorize(["int64(int64, int64)"], **kwargs)(_divide_lookup)
         cls._ufuncs["negative"] = numba.vectorize(["int64(int64)"], **kwargs)(_additive_inverse_lookup)
         cls._ufuncs["reciprocal"] = numba.vectorize(["int64(int64)"], **kwargs)(_multiplicative_inverse_lookup)
@@ -219,9 +278,9 @@ class UfuncMixin(type):
             return
 
         if not meta["operands"][0] == meta["field_operands"][0]:
-            raise TypeError(f"Operation '{ufunc.__name__}' requires the first operand to be a Galois field array, not {meta['types'][meta['operands'][0]]}.")
+            raise TypeError(f"Operation '{ufunc.__name__}' requires the first operand to be a Galois field array, not {type(inputs[meta['operands'][0]])}.")
         if len(meta["field_operands"]) > 1 and meta["operands"][1] == meta["field_operands"][1]:
-            raise TypeError(f"Operation '{ufunc.__name__}' requires the second operand to be an integer array, not {meta['types'][meta['operands'][1]]}.")
+            raise TypeError(f"Operation '{ufunc.__name__}' requires the second operand to be an integer array, not {type(inputs[meta['operands'][1]])}.")
 
         second = inputs[meta["operands"][1]]
         if isinstance(second, (int, np.integer)):
@@ -475,6 +534,9 @@ class UfuncMixin(type):
 
 ###################################################################################
 # Galois field arithmetic for any field using EXP, LOG, and ZECH_LOG lookup tables
+#
+# The tables are stored at the narrow dtype chosen by _table_dtype(), so each kernel widens its
+# table loads to int64 immediately -- the index arithmetic below must not wrap at the table dtype.
 ###################################################################################
 
 def _add_lookup(a, b):  # pragma: no cover
@@ -488,8 +550,8 @@ def _add_lookup(a, b):  # pragma: no cover
           = α^m * α^ZECH_LOG(n - m)
           = α^(m + ZECH_LOG(n - m))
     """
-    m = LOG[a]
-    n = LOG[b]
+    m = np.int64(LOG[a])
+    n = np.int64(LOG[b])
 
     # LOG[0] = -Inf, so catch these conditions
     if a == 0:
@@ -522,8 +584,8 @@ def _subtract_lookup(a, b):  # pragma: no cover
           = α^m + α^(e + n)
     """
     # Same as addition if n = LOG[b] + e
-    m = LOG[a]
-    n = LOG[b] + ZECH_E
+    m = np.int64(LOG[a])
+    n = np.int64(LOG[b]) + ZECH_E
 
     # LOG[0] = -Inf, so catch these conditions
     if b == 0:
@@ -537,12 +599,10 @@ def _subtract_lookup(a, b):  # pragma: no cover
         m, n = n, m
 
     z = n - m
-    if z == ZECH_E:
-        # ZECH_LOG[ZECH_E] = -Inf and α^(-Inf) = 0
+    if z == ZECH_E or z == ZECH_E + ORDER - 1:
+        # ZECH_LOG[ZECH_E] = -Inf and α^(-Inf) = 0. The doubled ZECH_LOG table absorbs indices
+        # above `order - 1`, so only the -Inf sentinel needs checking at both periods.
         return 0
-    if z >= ORDER - 1:
-        # Reduce index of ZECH_LOG by the multiplicative order of the field, i.e. `order - 1`
-        z -= ORDER - 1
 
     return EXP[m + ZECH_LOG[z]]
 
@@ -556,8 +616,8 @@ def _multiply_lookup(a, b):  # pragma: no cover
     a * b = α^m * α^n
           = α^(m + n)
     """
-    m = LOG[a]
-    n = LOG[b]
+    m = np.int64(LOG[a])
+    n = np.int64(LOG[b])
 
     # LOG[0] = -Inf, so catch these conditions
     if a == 0 or b == 0:
@@ -566,6 +626,17 @@ def _multiply_lookup(a, b):  # pragma: no cover
     return EXP[m + n]
 
 
+def _multiply_table_lookup(a, b):  # pragma: no cover
+    """
+    a in GF(p^m)
+    b in GF(p^m)
+    MUL[a, b] = a * b, the full multiplication table built for small fields
+
+    a * b = MUL[a, b]
+    """
+    return MUL[a, b]
+
+
 def _divide_lookup(a, b):  # pragma: no cover
     """
     a in GF(p^m)
@@ -578,8 +649,8 @@ def _divide_lookup(a, b):  # pragma: no cover
           = α^(ORDER - 1) * α^(m - n)
           = α^(ORDER - 1 + m - n)
     """
-    m = LOG[a]
-    n = LOG[b]
+    m = np.int64(LOG[a])
+    n = np.int64(LOG[b])
 
     # LOG[0] = -Inf, so catch these conditions
     if a == 0 or b == 0:
@@ -600,7 +671,7 @@ def _additive_inverse_lookup(a):  # pragma: no cover
        = α^e * α^n
        = α^(e + n)
     """
-    n = LOG[a]
+    n = np.int64(LOG[a])
 
     # LOG[0] = -Inf, so catch these conditions
     if a == 0:
@@ -620,7 +691,7 @@ def _multiplicative_inverse_lookup(a):  # pragma: no cover
           = α^(ORDER - 1) * α^(-m)
           = α^(ORDER - 1 - m)
     """
-    m = LOG[a]
+    m = np.int64(LOG[a])
 
     # LOG[0] = -Inf, so catch these conditions
     if a == 0:
@@ -649,8 +720,8 @@ def _scalar_multiply_lookup(a, b_int):  # pragma: no cover
     b = b_int % p_int
     """
     b = b_int % CHARACTERISTIC
-    m = LOG[a]
-    n = LOG[b]
+    m = np.int64(LOG[a])
+    n = np.int64(LOG[b])
 
     # LOG[0] = -Inf, so catch these conditions
     if a == 0 or b == 0:
@@ -672,7 +743,7 @@ def _power_lookup(a, b_int):  # pragma: no cover
                = 1 * α^(m * (b_int % (ORDER - 1)))
                = α^(m * (b_int % (ORDER - 1)))
     """
-    m = LOG[a]
+    m = np.int64(LOG[a])
 
     if b_int == 0:
         return 1